@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+build_kernels.py - Précompile les noyaux numériques de truth.py
+Produit le module _truth_kernels à côté de truth.py (nécessite numba ;
+le module produit dépend de numpy), utilisé avec TRUTH_KERNELS=1 à la place
+de la compilation JIT.
+"""
+
+import os
+import sys
+
+# Force truth à compiler ses noyaux avec numba plutôt qu'à charger
+# un _truth_kernels existant
+os.environ['TRUTH_KERNELS'] = '1'
+sys.modules['_truth_kernels'] = None
+
+from numba.pycc import CC
+
+import truth
+
+def main():
+    cc = CC('_truth_kernels')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('is_prime_u64', 'b1(i8)')(truth._is_prime_u64.py_func)
+    cc.export('pollard_rho_u64', 'i8(i8, i8)')(truth._pollard_rho_u64.py_func)
+    cc.compile()
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,39 @@ Affiche les conversions, propriétés mathématiques, trigonométrie, hashs, etc
 
 import math
 import hashlib
-import crcmod
+import zlib
 import base64
-from datetime import datetime
+import socket
+import struct
+import time
 import sys
+import os
+import importlib.util
+
+# Les noyaux compilés coûtent plus au chargement qu'ils ne rapportent sur une
+# analyse unique : ils ne sont activés que sur demande (TRUTH_KERNELS=1).
+# On prend alors le module précompilé par build_kernels.py s'il est présent
+# (il dépend de numpy), sinon la compilation JIT de numba
+_truth_kernels = None
+numba = None
+if os.environ.get('TRUTH_KERNELS') == '1':
+    # Sans numpy, l'import du module précompilé échoue bruyamment sur stderr
+    if importlib.util.find_spec('numpy') is not None:
+        try:
+            import _truth_kernels
+        except ImportError:
+            pass
+    if _truth_kernels is None:
+        try:
+            import numba
+        except ImportError:  # numba est optionnel : repli sur l'arithmétique Python
+            pass
+
+# Les noyaux *_u64 sont compilés par numba quand il est activé
+_njit = numba.njit(cache=True, fastmath=False) if numba is not None else (lambda f: f)
+
+# Borne au-delà de laquelle les fonctions trigonométriques ne sont pas calculées
+_TRIG_LIMIT = 1e8
 
 def analyze_number(number):
     """
@@ -17,6 +46,11 @@ def analyze_number(number):
     """
     results = {}
     
+    # Représentation décimale calculée une seule fois
+    s_num = str(number)
+    b_num = s_num.encode('ascii')
+    results['s_num'] = s_num
+    
     # Conversion de base
     results['decimal'] = number
     results['hexadecimal'] = hex(number)[2:].upper()
@@ -27,13 +61,18 @@ def analyze_number(number):
     results['english_words'] = number_to_english(number)
     results['parity'] = "Odd" if number % 2 else "Even"
     results['factors'] = factorize(number)
+    results['factors_str'] = ', '.join(map(str, results['factors'])) if len(results['factors']) > 1 else f"{results['factors'][0]}, 1"
     results['prime_status'] = "Prime" if is_prime(number) else "Composite"
-    results['divisible_by_8'] = [number * i for i in range(2, 10)]
+    results['multiples'] = tuple(number * i for i in range(2, 10))
+    results['multiples_str'] = ', '.join(map(str, results['multiples']))
     results['multiplied_by_2'] = number * 2
     results['divided_by_2'] = number / 2
     results['previous_primes'] = find_previous_primes(number, 8)
-    results['digit_sum'] = sum(int(d) for d in str(number))
-    results['digit_count'] = len(str(number))
+    results['previous_primes_str'] = ', '.join(map(str, results['previous_primes']))
+    # Somme des octets ASCII moins 48 ('0') par chiffre, sans int() par caractère
+    digits = b_num.lstrip(b'-')
+    results['digit_sum'] = sum(digits) - 48 * len(digits)
+    results['digit_count'] = len(s_num)
     results['log10'] = math.log10(number) if number > 0 else float('inf')
     results['natural_log'] = math.log(number) if number > 0 else float('inf')
     results['fibonacci'] = is_fibonacci(number)
@@ -46,22 +85,26 @@ def analyze_number(number):
     results['square_root'] = math.sqrt(number)
     results['cube_root'] = number ** (1/3)
     
-    # Trigonométrie
-    results['sin_deg'] = math.sin(math.radians(number))
-    results['cos_deg'] = math.cos(math.radians(number))
-    results['tan_deg'] = math.tan(math.radians(number))
-    results['sin_rad'] = math.sin(number)
-    results['cos_rad'] = math.cos(number)
-    results['tan_rad'] = math.tan(number)
+    # Trigonométrie (au-delà de _TRIG_LIMIT le résultat n'a plus de précision)
+    if abs(number) < _TRIG_LIMIT:
+        results['sin_deg'] = math.sin(math.radians(number))
+        results['cos_deg'] = math.cos(math.radians(number))
+        results['tan_deg'] = math.tan(math.radians(number))
+        results['sin_rad'] = math.sin(number)
+        results['cos_rad'] = math.cos(number)
+        results['tan_rad'] = math.tan(number)
+    else:
+        for key in ('sin_deg', 'cos_deg', 'tan_deg', 'sin_rad', 'cos_rad', 'tan_rad'):
+            results[key] = "Out of range"
     results['deg_to_rad'] = math.radians(number)
     results['rad_to_deg'] = math.degrees(number)
     
     # Hash et cryptographie
-    results['md5'] = hashlib.md5(str(number).encode()).hexdigest()
-    results['crc32'] = crc32_hash(str(number))
-    results['sha256'] = hashlib.sha256(str(number).encode()).hexdigest()
-    results['sha1'] = hashlib.sha1(str(number).encode()).hexdigest()
-    results['base64'] = base64.b64encode(str(number).encode()).decode()
+    results['md5'] = _hexdigest(_MD5, b_num)
+    results['crc32'] = crc32_hash(b_num)
+    results['sha256'] = _hexdigest(_SHA256, b_num)
+    results['sha1'] = _hexdigest(_SHA1, b_num)
+    results['base64'] = base64.b64encode(b_num).decode('ascii')
     
     # Programmation
     results['c_hex'] = f"0x{results['hexadecimal']}"
@@ -73,34 +116,50 @@ def analyze_number(number):
     # Internet
     results['ipv4'] = number_to_ipv4(number)
     
-    # Couleur
-    results['color_hex'] = f"#{results['hexadecimal'].zfill(6)}"
-    results['rgb'] = hex_to_rgb(results['hexadecimal'])
+    # Couleur (valeurs sur 24 bits uniquement)
+    if 0 <= number <= 0xFFFFFF:
+        results['color_hex'] = f"#{results['hexadecimal'].zfill(6)}"
+        results['rgb'] = hex_to_rgb(results['hexadecimal'])
+    else:
+        results['color_hex'] = "Invalid or out-of-range color"
+        results['rgb'] = None
     
     return results
 
+_UNITS = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+_TEENS = ["ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
+_TENS = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
+_THOUSANDS = ["", "thousand", "million", "billion", "trillion", "quadrillion", "quintillion",
+              "sextillion", "septillion", "octillion", "nonillion", "decillion", "undecillion",
+              "duodecillion", "tredecillion", "quattuordecillion", "quindecillion",
+              "sexdecillion", "septendecillion", "octodecillion", "novemdecillion", "vigintillion"]
+
+def _convert_hundreds(num):
+    """Convertit un nombre de 0 à 999 en mots anglais"""
+    if num == 0:
+        return ""
+    elif num < 10:
+        return _UNITS[num]
+    elif num < 20:
+        return _TEENS[num - 10]
+    elif num < 100:
+        return _TENS[num // 10] + (" " + _UNITS[num % 10] if num % 10 != 0 else "")
+    else:
+        return _UNITS[num // 100] + " hundred" + (" " + _convert_hundreds(num % 100) if num % 100 != 0 else "")
+
+# Table des mots de 0 à 999, construite une fois à l'import
+_HUNDREDS = [_convert_hundreds(i) for i in range(1000)]
+
+def _scale_name(chunk_count):
+    """Nom de la puissance 1000^chunk_count (notation 10^k au-delà de la table)"""
+    if chunk_count < len(_THOUSANDS):
+        return _THOUSANDS[chunk_count]
+    return f"times ten to the power {3 * chunk_count}"
+
 def number_to_english(n):
     """Convertit un nombre en mots anglais"""
     if n == 0:
         return "zero"
-    
-    units = ["", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
-    teens = ["ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen", "seventeen", "eighteen", "nineteen"]
-    tens = ["", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety"]
-    thousands = ["", "thousand", "million", "billion"]
-    
-    def convert_hundreds(num):
-        if num == 0:
-            return ""
-        elif num < 10:
-            return units[num]
-        elif num < 20:
-            return teens[num - 10]
-        elif num < 100:
-            return tens[num // 10] + (" " + units[num % 10] if num % 10 != 0 else "")
-        else:
-            return units[num // 100] + " hundred" + (" " + convert_hundreds(num % 100) if num % 100 != 0 else "")
-    
     if n < 0:
         return "negative " + number_to_english(-n)
     
@@ -110,15 +169,18 @@ def number_to_english(n):
     while n > 0:
         chunk = n % 1000
         if chunk != 0:
-            part = convert_hundreds(chunk)
             if chunk_count > 0:
-                part += " " + thousands[chunk_count]
-            parts.append(part)
+                parts.append(_HUNDREDS[chunk] + " " + _scale_name(chunk_count))
+            else:
+                parts.append(_HUNDREDS[chunk])
         n //= 1000
         chunk_count += 1
     
     return " ".join(reversed(parts))
 
+# Borne de la division par essais avant de passer à Pollard rho
+_TRIAL_LIMIT = 1000
+
 def factorize(n):
     """Factorise un nombre"""
     if n < 2:
@@ -126,60 +188,280 @@ def factorize(n):
     
     factors = []
     d = 2
-    while d * d <= n:
-        while n % d == 0:
-            factors.append(d)
-            n //= d
-        d += 1
+    bound = min(_TRIAL_LIMIT, math.isqrt(n))
+    while d <= bound:
+        if n % d == 0:
+            while n % d == 0:
+                factors.append(d)
+                n //= d
+            bound = min(_TRIAL_LIMIT, math.isqrt(n))
+        d += 1 if d == 2 else 2
     if n > 1:
+        _factor_rec(n, factors)
+    return sorted(factors)
+
+def _factor_rec(n, factors):
+    """Ajoute à factors les facteurs premiers de n (sans petits diviseurs)"""
+    if is_prime(n):
         factors.append(n)
-    return factors
+        return
+    d = _pollard_rho(n)
+    _factor_rec(d, factors)
+    _factor_rec(n // d, factors)
+
+def _pollard_rho(n):
+    """Trouve un diviseur non trivial de n composé (variante de Brent)"""
+    if n % 2 == 0:
+        return 2
+    r = math.isqrt(n)
+    if r * r == n:
+        return r
+    
+    if _HAVE_U64_KERNELS and n < _KERNEL_LIMIT:
+        if _truth_kernels is not None:
+            rho = _truth_kernels.pollard_rho_u64
+        else:
+            rho = _pollard_rho_u64
+        c = 1
+        while True:
+            g = rho(n, c)
+            if g != n:
+                return g
+            c += 1
+    
+    m = 128  # pgcd calculé tous les m pas
+    c = 1
+    while True:
+        y, r, q, g = 2, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # Le lot a dépassé le diviseur : on reprend pas à pas
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+        c += 1
+
+# Petits nombres premiers : division préalable puis témoins de Miller-Rabin
+# (ensemble déterministe pour tout n < 3.18 * 10^23, probabiliste au-delà)
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
 
 def is_prime(n):
-    """Vérifie si un nombre est premier"""
+    """Vérifie si un nombre est premier (Miller-Rabin déterministe)"""
     if n < 2:
         return False
-    for i in range(2, int(math.sqrt(n)) + 1):
-        if n % i == 0:
+    if _HAVE_U64_KERNELS and n < _KERNEL_LIMIT:
+        if _truth_kernels is not None:
+            return _truth_kernels.is_prime_u64(n)
+        return _is_prime_u64(n)
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    
+    # n - 1 = d * 2^s avec d impair
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in _SMALL_PRIMES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
     return True
 
+# Les noyaux ne traitent que n < 2^31, où a * b tient sur 64 bits ; au-delà
+# le pow() de Python est plus rapide qu'une multiplication modulaire émulée
+_KERNEL_LIMIT = 1 << 31
+
+@_njit
+def _powmod_u64(a, e, n):
+    """(a ** e) % n par exponentiation rapide"""
+    r = 1
+    a %= n
+    while e:
+        if e & 1:
+            r = r * a % n
+        a = a * a % n
+        e >>= 1
+    return r
+
+@_njit
+def _gcd_u64(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+@_njit
+def _is_prime_u64(n):
+    """Miller-Rabin déterministe pour 2 <= n < 2^31"""
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _SMALL_PRIMES:
+        x = _powmod_u64(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        composite = True
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                composite = False
+                break
+        if composite:
+            return False
+    return True
+
+@_njit
+def _pollard_rho_u64(n, c):
+    """Pollard rho (Brent) pour n < 2^31 ; retourne n en cas d'échec avec ce c"""
+    y, r, q, g = 2, 1, 1, 1
+    x = ys = 2
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(128, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = _gcd_u64(q, n)
+            k += 128
+        r *= 2
+    if g == n:
+        g = 1
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = _gcd_u64(abs(x - ys), n)
+    return g
+
+# Vrai si les noyaux *_u64 sont compilés (AOT ou JIT)
+_HAVE_U64_KERNELS = _truth_kernels is not None or numba is not None
+
+# Le crible ne sert que de pré-filtre par les petits nombres premiers ;
+# les candidats sont confirmés par is_prime
+_SIEVE_LIMIT = 4096
+
+def _base_primes(limit):
+    """Nombres premiers jusqu'à limit (crible d'Ératosthène)"""
+    base = bytearray([1]) * (limit + 1)
+    base[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit) + 1):
+        if base[i]:
+            base[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return [i for i, flag in enumerate(base) if flag]
+
+_BASE_PRIMES = _base_primes(_SIEVE_LIMIT)
+
+def _segmented_sieve(lo, hi):
+    """Retourne les candidats de [lo, hi] sans petit diviseur (crible segmenté)"""
+    lo = max(lo, 2)
+    if hi < lo:
+        return []
+    
+    # Élimination des multiples des petits nombres premiers dans le segment
+    sieve = bytearray([1]) * (hi - lo + 1)
+    # Un premier plus grand que le segment n'y barre qu'au plus un nombre
+    bound = min(math.isqrt(hi), hi - lo + 1)
+    for p in _BASE_PRIMES:
+        if p > bound:
+            break
+        start = max(p * p, (lo + p - 1) // p * p)
+        if start <= hi:
+            sieve[start - lo::p] = bytes(len(range(start, hi + 1, p)))
+    
+    return [lo + i for i, flag in enumerate(sieve) if flag]
+
 def find_previous_primes(n, count):
     """Trouve les nombres premiers précédents"""
     primes = []
-    candidate = n - 1
-    while len(primes) < count and candidate > 1:
-        if is_prime(candidate):
-            primes.append(candidate)
-        candidate -= 1
+    hi = n - 1
+    # Fenêtre initiale ~ count * ln(n), doublée tant qu'elle ne suffit pas
+    window = max(64, count * n.bit_length())
+    while len(primes) < count and hi > 1:
+        lo = max(2, hi - window + 1)
+        for candidate in reversed(_segmented_sieve(lo, hi)):
+            if is_prime(candidate):
+                primes.append(candidate)
+                if len(primes) == count:
+                    break
+        hi = lo - 1
+        window *= 2
     return primes
 
+# Les nombres de Fibonacci inférieurs à 2^63 (moins d'une centaine)
+_FIB_LIMIT = 1 << 63
+_FIBS = set()
+_a, _b = 0, 1
+while _a < _FIB_LIMIT:
+    _FIBS.add(_a)
+    _a, _b = _b, _a + _b
+_FIBS = frozenset(_FIBS)
+del _a, _b
+
 def is_fibonacci(n):
     """Vérifie si un nombre est dans la suite de Fibonacci"""
     if n < 0:
         return False
+    if n < _FIB_LIMIT:
+        return n in _FIBS
     x = 5 * n * n
     return math.isqrt(x + 4) ** 2 == x + 4 or math.isqrt(x - 4) ** 2 == x - 4
 
+# Contextes de hachage vides, copiés à chaque calcul.
+# Usage non cryptographique : évite les contrôles FIPS d'OpenSSL
+_MD5 = hashlib.new('md5', usedforsecurity=False)
+_SHA1 = hashlib.new('sha1', usedforsecurity=False)
+_SHA256 = hashlib.new('sha256', usedforsecurity=False)
+
+def _hexdigest(prototype, data):
+    """Calcule le hash de data à partir d'une copie du contexte vide"""
+    h = prototype.copy()
+    h.update(data)
+    return h.hexdigest()
+
 def crc32_hash(data):
-    """Calcule le CRC32"""
-    crc32 = crcmod.predefined.Crc('crc-32')
-    crc32.update(data.encode())
-    return crc32.hexdigest()
+    """Calcule le CRC32 (data en bytes)"""
+    return format(zlib.crc32(data), '08X')
 
 def unix_to_datetime(timestamp):
-    """Convertit un timestamp UNIX en datetime"""
-    try:
-        if 0 <= timestamp <= 2000000000:  # Timestamps UNIX raisonnables
-            return datetime.fromtimestamp(timestamp).strftime('%A, %d %B %Y at %H:%M:%S UTC')
-    except (ValueError, OSError):
-        pass
+    """Convertit un timestamp UNIX en date et heure UTC"""
+    if 0 <= timestamp <= 2000000000:  # Timestamps UNIX raisonnables
+        return time.strftime('%A, %d %B %Y at %H:%M:%S UTC', time.gmtime(timestamp))
     return "Invalid or out-of-range timestamp"
 
 def number_to_ipv4(n):
     """Convertit un nombre en IPv4"""
     if 0 <= n <= 0xFFFFFFFF:
-        return f"{(n >> 24) & 0xFF}.{(n >> 16) & 0xFF}.{(n >> 8) & 0xFF}.{n & 0xFF}"
+        return socket.inet_ntoa(struct.pack('>I', n))
     return "Invalid IPv4 address"
 
 def hex_to_rgb(hex_str):
@@ -193,153 +475,166 @@ def hex_to_rgb(hex_str):
     except ValueError:
         return (0, 0, 0)
 
+def _format_float(value, spec):
+    """Formate un flottant, ou renvoie tel quel un message"""
+    return format(value, spec) if isinstance(value, float) else value
+
 def display_results(results):
     """Affiche les résultats de manière formatée"""
-    print("=" * 80)
-    print(f"ANALYSE COMPLÈTE DU NOMBRE {results['decimal']}")
-    print("=" * 80)
-    
-    print("\nNOTATIONS, TRANSLATING INTO NUMBER SYSTEM")
-    print(f"Decimal number {results['decimal']}")
-    print(f"    {results['decimal']} to hexadecimal value")
-    print(f"        {results['hexadecimal']}")
-    print(f"    {results['decimal']} to binary value")
-    print(f"        {results['binary']}")
-    print(f"    {results['decimal']} to octal value")
-    print(f"        {results['octal']}")
-    
-    print(f"\nHexadecimal number {results['hexadecimal']}")
-    print(f"    {results['hexadecimal']} to decimal value")
-    print(f"        {results['decimal']}")
-    print(f"    {results['hexadecimal']} to binary value")
-    print(f"        {results['binary']}")
-    print(f"    {results['hexadecimal']} to octal value")
-    print(f"        {results['octal']}")
-    
-    print(f"\nBinary number {results['binary']}")
-    print(f"    {results['binary']} to decimal value")
-    print(f"        {results['decimal']}")
-    print(f"    {results['binary']} to hexadecimal value")
-    print(f"        {results['hexadecimal']}")
-    print(f"    {results['binary']} to octal value")
-    print(f"        {results['octal']}")
-    
-    print(f"\nOctal number {results['octal']}")
-    print(f"    {results['octal']} to decimal value")
-    print(f"        {results['decimal']}")
-    print(f"    {results['octal']} to hexadecimal value")
-    print(f"        {results['hexadecimal']}")
-    print(f"    {results['octal']} to binary value")
-    print(f"        {results['binary']}")
-    
-    print("\nBASIC ARITHMETIC AND ALGEBRAIC PROPERTIES")
-    print(f"    Number {results['decimal']} in English, number {results['decimal']} in words:")
-    print(f"        {results['english_words']}")
-    print(f"    Parity")
-    print(f"        {results['parity']} Number {results['decimal']}")
-    print(f"    Factorization, multipliers, divisors of {results['decimal']}")
-    factors_str = ', '.join(map(str, results['factors'])) if len(results['factors']) > 1 else f"{results['factors'][0]}, 1"
-    print(f"        {factors_str}")
-    print(f"    Prime or Composite Number")
-    print(f"        {results['prime_status']} Number {results['decimal']}")
-    print(f"    First 8 numbers divisible by integer number {results['decimal']}")
-    print(f"        {', '.join(map(str, results['divisible_by_8']))}")
-    print(f"    The number {results['decimal']} multiplied by two equals")
-    print(f"        {results['multiplied_by_2']}")
-    print(f"    The number {results['decimal']} divided by 2")
-    print(f"        {results['divided_by_2']}")
-    print(f"    8 prime numbers list before the number")
-    print(f"        {', '.join(map(str, results['previous_primes']))}")
-    print(f"    Sum of decimal digits")
-    print(f"        {results['digit_sum']}")
-    print(f"    Number of digits")
-    print(f"        {results['digit_count']}")
-    print(f"    Decimal logarithm for {results['decimal']}")
-    print(f"        {results['log10']}")
-    print(f"    Natural logarithm for {results['decimal']}")
-    print(f"        {results['natural_log']}")
-    print(f"    Is it Fibonacci number?")
-    print(f"        {'Yes' if results['fibonacci'] else 'No'}")
-    print(f"    The number on 1 is more than number {results['decimal']},")
-    print(f"    next number")
-    print(f"        number {results['next_number']}")
-    print(f"    The number on one is less than number {results['decimal']},")
-    print(f"    previous number")
-    print(f"        {results['previous_number']}")
-    
-    print("\nPOWERS, ROOTS")
-    print(f"    {results['decimal']} raising to the second power")
-    print(f"        {results['square']}")
-    print(f"    {results['decimal']} raising to the third power")
-    print(f"        {results['cube']}")
-    print(f"    Square root of {results['decimal']}")
-    print(f"        {results['square_root']}")
-    print(f"    Cubic, cube root of the number {results['decimal']} =")
-    print(f"        {results['cube_root']}")
-    
-    print("\nTRIGONOMETRIC FUNCTIONS, TRIGONOMETRY")
-    print(f"    sine, sin {results['decimal']} degrees, sin {results['decimal']}°")
-    print(f"        {results['sin_deg']:.10f}")
-    print(f"    cosine, cos {results['decimal']} degrees, cos {results['decimal']}°")
-    print(f"        {results['cos_deg']:.10f}")
-    print(f"    tangent, tg {results['decimal']} degrees, tg {results['decimal']}°")
-    print(f"        {results['tan_deg']:.10f}")
-    print(f"    sine, sin {results['decimal']} radians")
-    print(f"        {results['sin_rad']}")
-    print(f"    cosine, cos {results['decimal']} radians")
-    print(f"        {results['cos_rad']}")
-    print(f"    tangent, tg {results['decimal']} radians equals")
-    print(f"        {results['tan_rad']}")
-    print(f"    {results['decimal']} degrees, {results['decimal']}° =")
-    print(f"        {results['deg_to_rad']} radians")
-    print(f"    {results['decimal']} radians =")
-    print(f"        {results['rad_to_deg']} degrees, {results['rad_to_deg']}°")
-    
-    print("\nCHECKSUMS, HASHES, CRYPTOGRAPHY")
-    print(f"    Hash MD5({results['decimal']})")
-    print(f"        {results['md5']}")
-    print(f"    CRC-32, CRC32({results['decimal']})")
-    print(f"        {results['crc32']}")
-    print(f"    SHA-256 hash, SHA256({results['decimal']})")
-    print(f"        {results['sha256']}")
-    print(f"    SHA1, SHA-1({results['decimal']})")
-    print(f"        {results['sha1']}")
-    print(f"    Base64")
-    print(f"        {results['base64']}")
-    
-    print("\nPROGRAMMING LANGUAGES")
-    print(f"    C++, CPP, C value {results['decimal']}")
-    print(f"        {results['c_hex']}")
-    print(f"    Delphi, Pascal value for number {results['decimal']}")
-    print(f"        {results['delphi_hex']}")
-    
-    print("\nDATE AND TIME")
-    print(f"    Convert UNIX-timestamp {results['decimal']} to date and time")
-    print(f"        {results['unix_time']}")
-    
-    print("\nINTERNET")
-    print(f"    Convert the number to IPv4 Internet network address, long2ip")
-    print(f"        {results['ipv4']}")
-    print(f"    {results['decimal']} in Wikipedia:")
-    print(f"        {results['decimal']}")
-    
-    print("\nOTHER PROPERTIES OF THE NUMBER")
-    print(f"    Short link to this page DEC")
-    print(f"        https://bikubik.com/en/{results['decimal']}")
-    print(f"    Short link to this page HEX")
-    print(f"        https://bikubik.com/en/x{results['hexadecimal']}")
-    print(f"    Phone number")
-    print(f"        {str(results['decimal'])[:3]}-{str(results['decimal'])[3:5]}-{str(results['decimal'])[5:7]}")
-    
-    print("\nCOLOR BY NUMBER")
-    print(f"    RGB color by number {results['decimal']}, by hex value")
-    print(f"        {results['color_hex']} - {results['rgb']}")
-    print(f"    HTML CSS color code {results['color_hex']}")
-    print(f"        .color-mn {{ color: {results['color_hex']}; }}")
-    print(f"        .color-bg {{ background-color: {results['color_hex']}; }}")
-    
-    print("\nCOLOR FOR CURRENT NUMBER")
-    print(f"    {results['color_hex']}")
+    # Les lignes sont accumulées puis écrites en un seul appel
+    out = []
+    app = out.append
+    app("=" * 80)
+    app(f"ANALYSE COMPLÈTE DU NOMBRE {results['decimal']}")
+    app("=" * 80)
+    
+    app("\nNOTATIONS, TRANSLATING INTO NUMBER SYSTEM")
+    app(f"Decimal number {results['decimal']}")
+    app(f"    {results['decimal']} to hexadecimal value")
+    app(f"        {results['hexadecimal']}")
+    app(f"    {results['decimal']} to binary value")
+    app(f"        {results['binary']}")
+    app(f"    {results['decimal']} to octal value")
+    app(f"        {results['octal']}")
+    
+    app(f"\nHexadecimal number {results['hexadecimal']}")
+    app(f"    {results['hexadecimal']} to decimal value")
+    app(f"        {results['decimal']}")
+    app(f"    {results['hexadecimal']} to binary value")
+    app(f"        {results['binary']}")
+    app(f"    {results['hexadecimal']} to octal value")
+    app(f"        {results['octal']}")
+    
+    app(f"\nBinary number {results['binary']}")
+    app(f"    {results['binary']} to decimal value")
+    app(f"        {results['decimal']}")
+    app(f"    {results['binary']} to hexadecimal value")
+    app(f"        {results['hexadecimal']}")
+    app(f"    {results['binary']} to octal value")
+    app(f"        {results['octal']}")
+    
+    app(f"\nOctal number {results['octal']}")
+    app(f"    {results['octal']} to decimal value")
+    app(f"        {results['decimal']}")
+    app(f"    {results['octal']} to hexadecimal value")
+    app(f"        {results['hexadecimal']}")
+    app(f"    {results['octal']} to binary value")
+    app(f"        {results['binary']}")
+    
+    app("\nBASIC ARITHMETIC AND ALGEBRAIC PROPERTIES")
+    app(f"    Number {results['decimal']} in English, number {results['decimal']} in words:")
+    app(f"        {results['english_words']}")
+    app(f"    Parity")
+    app(f"        {results['parity']} Number {results['decimal']}")
+    app(f"    Factorization, multipliers, divisors of {results['decimal']}")
+    app(f"        {results['factors_str']}")
+    app(f"    Prime or Composite Number")
+    app(f"        {results['prime_status']} Number {results['decimal']}")
+    app(f"    First 8 numbers divisible by integer number {results['decimal']}")
+    app(f"        {results['multiples_str']}")
+    app(f"    The number {results['decimal']} multiplied by two equals")
+    app(f"        {results['multiplied_by_2']}")
+    app(f"    The number {results['decimal']} divided by 2")
+    app(f"        {results['divided_by_2']}")
+    app(f"    8 prime numbers list before the number")
+    app(f"        {results['previous_primes_str']}")
+    app(f"    Sum of decimal digits")
+    app(f"        {results['digit_sum']}")
+    app(f"    Number of digits")
+    app(f"        {results['digit_count']}")
+    app(f"    Decimal logarithm for {results['decimal']}")
+    app(f"        {results['log10']}")
+    app(f"    Natural logarithm for {results['decimal']}")
+    app(f"        {results['natural_log']}")
+    app(f"    Is it Fibonacci number?")
+    app(f"        {'Yes' if results['fibonacci'] else 'No'}")
+    app(f"    The number on 1 is more than number {results['decimal']},")
+    app(f"    next number")
+    app(f"        number {results['next_number']}")
+    app(f"    The number on one is less than number {results['decimal']},")
+    app(f"    previous number")
+    app(f"        {results['previous_number']}")
+    
+    app("\nPOWERS, ROOTS")
+    app(f"    {results['decimal']} raising to the second power")
+    app(f"        {results['square']}")
+    app(f"    {results['decimal']} raising to the third power")
+    app(f"        {results['cube']}")
+    app(f"    Square root of {results['decimal']}")
+    app(f"        {results['square_root']}")
+    app(f"    Cubic, cube root of the number {results['decimal']} =")
+    app(f"        {results['cube_root']}")
+    
+    app("\nTRIGONOMETRIC FUNCTIONS, TRIGONOMETRY")
+    app(f"    sine, sin {results['decimal']} degrees, sin {results['decimal']}°")
+    app(f"        {_format_float(results['sin_deg'], '.10f')}")
+    app(f"    cosine, cos {results['decimal']} degrees, cos {results['decimal']}°")
+    app(f"        {_format_float(results['cos_deg'], '.10f')}")
+    app(f"    tangent, tg {results['decimal']} degrees, tg {results['decimal']}°")
+    app(f"        {_format_float(results['tan_deg'], '.10f')}")
+    app(f"    sine, sin {results['decimal']} radians")
+    app(f"        {results['sin_rad']}")
+    app(f"    cosine, cos {results['decimal']} radians")
+    app(f"        {results['cos_rad']}")
+    app(f"    tangent, tg {results['decimal']} radians equals")
+    app(f"        {results['tan_rad']}")
+    app(f"    {results['decimal']} degrees, {results['decimal']}° =")
+    app(f"        {results['deg_to_rad']} radians")
+    app(f"    {results['decimal']} radians =")
+    app(f"        {results['rad_to_deg']} degrees, {results['rad_to_deg']}°")
+    
+    app("\nCHECKSUMS, HASHES, CRYPTOGRAPHY")
+    app(f"    Hash MD5({results['decimal']})")
+    app(f"        {results['md5']}")
+    app(f"    CRC-32, CRC32({results['decimal']})")
+    app(f"        {results['crc32']}")
+    app(f"    SHA-256 hash, SHA256({results['decimal']})")
+    app(f"        {results['sha256']}")
+    app(f"    SHA1, SHA-1({results['decimal']})")
+    app(f"        {results['sha1']}")
+    app(f"    Base64")
+    app(f"        {results['base64']}")
+    
+    app("\nPROGRAMMING LANGUAGES")
+    app(f"    C++, CPP, C value {results['decimal']}")
+    app(f"        {results['c_hex']}")
+    app(f"    Delphi, Pascal value for number {results['decimal']}")
+    app(f"        {results['delphi_hex']}")
+    
+    app("\nDATE AND TIME")
+    app(f"    Convert UNIX-timestamp {results['decimal']} to date and time")
+    app(f"        {results['unix_time']}")
+    
+    app("\nINTERNET")
+    app(f"    Convert the number to IPv4 Internet network address, long2ip")
+    app(f"        {results['ipv4']}")
+    app(f"    {results['decimal']} in Wikipedia:")
+    app(f"        {results['decimal']}")
+    
+    app("\nOTHER PROPERTIES OF THE NUMBER")
+    app(f"    Short link to this page DEC")
+    app(f"        https://bikubik.com/en/{results['decimal']}")
+    app(f"    Short link to this page HEX")
+    app(f"        https://bikubik.com/en/x{results['hexadecimal']}")
+    app(f"    Phone number")
+    s_num = results['s_num']
+    app(f"        {s_num[:3]}-{s_num[3:5]}-{s_num[5:7]}")
+    
+    app("\nCOLOR BY NUMBER")
+    app(f"    RGB color by number {results['decimal']}, by hex value")
+    if results['rgb'] is None:
+        app(f"        {results['color_hex']}")
+    else:
+        app(f"        {results['color_hex']} - {results['rgb']}")
+        app(f"    HTML CSS color code {results['color_hex']}")
+        app(f"        .color-mn {{ color: {results['color_hex']}; }}")
+        app(f"        .color-bg {{ background-color: {results['color_hex']}; }}")
+    
+    app("\nCOLOR FOR CURRENT NUMBER")
+    app(f"    {results['color_hex']}")
+    
+    sys.stdout.write('\n'.join(out))
+    sys.stdout.write('\n')
 
 def main():
     if len(sys.argv) != 2: